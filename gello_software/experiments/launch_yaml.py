@@ -8,9 +8,7 @@ from typing import Optional
 
 import tyro
 import zmq.error
-from omegaconf import OmegaConf
-
-from gello.utils.launch_utils import instantiate_from_dict
+from gello.utils.launch_utils import instantiate_from_dict, load_yaml
 
 # Global variables for cleanup
 active_threads = []
@@ -40,14 +38,14 @@ def cleanup():
     print("Cleanup completed.")
 
 
-def wait_for_server_ready(port, host="127.0.0.1", timeout_seconds=5):
+def wait_for_server_ready(port, host="127.0.0.1", timeout_seconds=5, endpoint=None):
     """Wait for ZMQ server to be ready with retry logic."""
     from gello.zmq_core.robot_node import ZMQClientRobot
 
     attempts = int(timeout_seconds * 10)  # 0.1s intervals
     for attempt in range(attempts):
         try:
-            client = ZMQClientRobot(port=port, host=host)
+            client = ZMQClientRobot(port=port, host=host, endpoint=endpoint)
             time.sleep(0.1)
             return True
         except (zmq.error.ZMQError, Exception):
@@ -58,7 +56,7 @@ def wait_for_server_ready(port, host="127.0.0.1", timeout_seconds=5):
             time.sleep(0.1)
             if attempt == attempts - 1:
                 raise RuntimeError(
-                    f"Server failed to start on {host}:{port} within {timeout_seconds} seconds"
+                    f"Server failed to start on {endpoint or f'{host}:{port}'} within {timeout_seconds} seconds"
                 )
     return False
 
@@ -96,13 +94,9 @@ def main():
     bimanual = args.right_config_path is not None
 
     # Load configs
-    left_cfg = OmegaConf.to_container(
-        OmegaConf.load(args.left_config_path), resolve=True
-    )
+    left_cfg = load_yaml(args.left_config_path)
     if bimanual:
-        right_cfg = OmegaConf.to_container(
-            OmegaConf.load(args.right_config_path), resolve=True
-        )
+        right_cfg = load_yaml(args.right_config_path)
 
     # Create agent
     if bimanual:
@@ -118,9 +112,7 @@ def main():
     # Create robot(s)
     left_robot_cfg = left_cfg["robot"]
     if isinstance(left_robot_cfg.get("config"), str):
-        left_robot_cfg["config"] = OmegaConf.to_container(
-            OmegaConf.load(left_robot_cfg["config"]), resolve=True
-        )
+        left_robot_cfg["config"] = load_yaml(left_robot_cfg["config"])
         
     left_robot = instantiate_from_dict(left_robot_cfg)
 
@@ -129,9 +121,7 @@ def main():
 
         right_robot_cfg = right_cfg["robot"]
         if isinstance(right_robot_cfg.get("config"), str):
-            right_robot_cfg["config"] = OmegaConf.to_container(
-                OmegaConf.load(right_robot_cfg["config"]), resolve=True
-            )
+            right_robot_cfg["config"] = load_yaml(right_robot_cfg["config"])
 
         right_robot = instantiate_from_dict(right_robot_cfg)
         robot = BimanualRobot(left_robot, right_robot)
@@ -169,14 +159,22 @@ def main():
         robot_client = ZMQClientRobot(port=server_port, host=server_host)
     else:  # Direct robot (hardware)
         from gello.env import RobotEnv
-        from gello.zmq_core.robot_node import ZMQClientRobot, ZMQServerRobot
+        from gello.zmq_core.robot_node import (
+            ZMQClientRobot,
+            ZMQServerRobot,
+            loopback_ipc_endpoint,
+        )
 
         # Get server configuration (use a different default port for hardware)
         hardware_port = cfg.get("hardware_server_port", 6001)
         hardware_host = "127.0.0.1"
+        # Server and client share this process's host, so use ipc:// on loopback
+        hardware_endpoint = loopback_ipc_endpoint(hardware_port, hardware_host)
 
         # Create ZMQ server for the hardware robot
-        server = ZMQServerRobot(robot, port=hardware_port, host=hardware_host)
+        server = ZMQServerRobot(
+            robot, port=hardware_port, host=hardware_host, endpoint=hardware_endpoint
+        )
         server_thread = threading.Thread(target=server.serve, daemon=False)
         server_thread.start()
 
@@ -186,13 +184,17 @@ def main():
 
         # Wait for server to be ready
         print(
-            f"Waiting for hardware server to start on {hardware_host}:{hardware_port}..."
+            f"Waiting for hardware server to start on {hardware_endpoint or f'{hardware_host}:{hardware_port}'}..."
+        )
+        wait_for_server_ready(
+            hardware_port, hardware_host, endpoint=hardware_endpoint
         )
-        wait_for_server_ready(hardware_port, hardware_host)
         print("Hardware server ready!")
 
         # Create client to communicate with hardware
-        robot_client = ZMQClientRobot(port=hardware_port, host=hardware_host)
+        robot_client = ZMQClientRobot(
+            port=hardware_port, host=hardware_host, endpoint=hardware_endpoint
+        )
         
     env = RobotEnv(robot_client, control_rate_hz=cfg.get("hz", 30))
     
@@ -8,14 +8,26 @@ from gello.robots.robot import Robot
 
 
 class Rate:
+    # Sleep until this close to the deadline, then spin for the remainder.
+    SPIN_MARGIN = 0.0005
+
     def __init__(self, rate: float):
-        self.last = time.time()
+        self.last = time.perf_counter()
         self.rate = rate
 
     def sleep(self) -> None:
-        while self.last + 1.0 / self.rate > time.time():
-            time.sleep(0.0001)
-        self.last = time.time()
+        period = 1.0 / self.rate
+        deadline = self.last + period
+        remaining = deadline - time.perf_counter()
+        if remaining > 2 * self.SPIN_MARGIN:
+            time.sleep(remaining - self.SPIN_MARGIN)
+        while time.perf_counter() < deadline:
+            # Release the GIL so server and gripper threads can run during the spin
+            time.sleep(0)
+        # Advance on the fixed schedule so wakeup latency does not accumulate;
+        # after overrunning a whole period, restart from now instead of bursting
+        now = time.perf_counter()
+        self.last = deadline if now - deadline < period else now
 
 
 class RobotEnv:
@@ -1,49 +1,186 @@
+import logging
+import os
+import struct
 import time
 import threading
+from collections import deque
 from pyDHgripper import PGE    
 
+logger = logging.getLogger(__name__)
+
+# PGE Modbus 寄存器：0x0103 目标位置，0x0104 速度（力在 0x0101，中间 0x0102 为保留寄存器）
+_PGE_SLAVE_ID = 0x01
+_PGE_POS_REG = 0x0103
+# 0x10 应答帧：从站地址、功能码、起始地址、寄存器数量、CRC，共 8 字节
+_PGE_WRITE_REPLY_LEN = 8
+_PGE_REPLY_TIMEOUT = 0.1
+
 class DhGripper:
-    def __init__(self, port, binary_mode, threshold):
+    def __init__(
+        self,
+        port,
+        binary_mode,
+        threshold,
+        read_period=0.1,
+        bus_cpu=None,
+        bus_priority=20,
+    ):
         """
             初始化夹爪驱动
+
+            read_period: 位置缓存的有效期 (s)，过期后才触发一次读取；
+                每次 read_pos 约占用总线 40ms，默认与原轮询间隔一致
+            bus_cpu: 总线线程绑定的 CPU 核，None 表示不绑定
+            bus_priority: 总线线程的 SCHED_FIFO 优先级，None 表示保持默认调度
         """
         self.position = None
+        self._position = None
         self._stop_flag = False
         self.binary_mode = binary_mode
         self.threshold = threshold
         self.alpha = 1
         self.last_pos = 0
-        self.first = True
-        self._lock = threading.Lock()
+        # 上次下发的力，未变化时跳过重复写入；速度随位置在每帧 0x10 中下发
+        self._last_force = None
+        # move() 最近一次放入通道的命令：调用方线程在 move() 中读写；
+        # 总线线程只在写入失败时将其清为 None，让同一命令可以重发
+        self._last_queued = None
+        # 位置超过 read_period 秒未刷新才会触发新的读取
+        self.read_period = read_period
+        self._last_read_ts = 0.0
+        self._read_pending = False
+        self.bus_cpu = bus_cpu
+        self.bus_priority = bus_priority
+        # 单生产者单消费者通道：只保留最新的 (pos, speed, force) 命令，
+        # append/popleft 在 GIL 下是原子操作，无需加锁
+        self._cmd = deque(maxlen=1)
+        # 有新命令或读请求时唤醒总线线程
+        self._wakeup = threading.Event()
         self.gripper = PGE(port=port)
-        # 启动后台线程定期更新位置
-        self._thread = threading.Thread(target=self._update_position, daemon=True)
+        # 读取 0x10 应答帧时的超时，避免从站无应答时总线线程永久阻塞
+        self.gripper.ser.timeout = _PGE_REPLY_TIMEOUT
+        self._set_low_latency()
+        self._read()
+        # 启动总线线程，独占串口：下发命令并按需读取位置
+        self._thread = threading.Thread(target=self._bus_loop, daemon=True)
         self._thread.start()
-        time.sleep(0.5)
         
-    def _update_position(self):
+    def _bus_loop(self):
         """
-            更新夹爪位置线程
+            串口总线线程，唯一访问 PGE 句柄的线程
         """
+        self._setup_realtime()
         while not self._stop_flag:
-            with self._lock:
-                pos = self.gripper.read_pos(is_read=True) 
-            self._position = pos
-            time.sleep(0.1)  
+            # 等待新请求，超时仅用于检查退出标志
+            if not self._wakeup.wait(timeout=0.1):
+                continue
+            # 先清除再取命令，之后到达的请求会重新唤醒本线程
+            self._wakeup.clear()
+            try:
+                cmd = self._cmd.popleft()
+            except IndexError:
+                cmd = None
+            if cmd is not None:
+                self._write(*cmd)
+            if self._read_pending:
+                self._read()
+
+    def _set_low_latency(self):
+        """
+            开启串口 ASYNC_LOW_LATENCY，避免 USB 转串口 16ms 的 latency_timer 合并延迟
+        """
+        # pyserial 在 Linux 下通过 TIOCGSERIAL/TIOCSSERIAL 实现该选项
+        try:
+            self.gripper.ser.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            logger.warning("无法开启串口低延迟模式: %s", e)
+
+    def _setup_realtime(self):
+        """
+            将当前线程绑定到 bus_cpu 并提升为 SCHED_FIFO（失败时仅告警）
+        """
+        # Linux 下 pid 0 表示调用线程本身
+        try:
+            if self.bus_cpu is not None:
+                os.sched_setaffinity(0, {self.bus_cpu})
+            if self.bus_priority is not None:
+                os.sched_setscheduler(
+                    0, os.SCHED_FIFO, os.sched_param(self.bus_priority)
+                )
+        except (AttributeError, OSError) as e:
+            logger.warning("无法设置总线线程实时调度: %s", e)
+
+    def _read(self):
+        """
+            读取一次夹爪位置（仅在总线线程或启动时调用）
+        """
+        try:
+            # 只有本线程写 _position，读者无需加锁
+            self._position = self.gripper.read_pos(is_read=True)
+        except Exception as e:
+            logger.error("夹爪读取失败: %s", e)
+        self._last_read_ts = time.monotonic()
+        self._read_pending = False
+
+    def _write(self, position, speed, force):
+        """
+            向夹爪下发一条运动命令（仅在总线线程中调用）
+        """
+        try:
+            if force != self._last_force:
+                self.gripper.set_force(val=force)
+                self._last_force = force
+            self._write_pos_speed(position, speed)
+        except Exception as e:
+            logger.error("夹爪运动命令失败: %s", e)
+            # 写入失败时允许调用方重新下发同一条命令
+            self._last_queued = None
             
+    def _write_pos_speed(self, position, speed):
+        """
+            用一帧 Modbus 0x10（写多个寄存器）同时下发位置和速度
+        """
+        position = int(position)
+        speed = int(speed)
+        if not 0 <= position <= 1000 or not 1 <= speed <= 100:
+            raise RuntimeError(f"夹爪命令越界: position={position}, speed={speed}")
+        frame = struct.pack(
+            ">BBHHBHH", _PGE_SLAVE_ID, 0x10, _PGE_POS_REG, 2, 4, position, speed
+        )
+        frame += self.gripper.crc16(frame).to_bytes(2, byteorder="little")
+        # 丢弃之前读请求迟到或残缺的应答，避免被当作本帧的应答解析
+        self.gripper.ser.reset_input_buffer()
+        self.gripper.ser.write(frame)
+        # 等待从站应答后再返回，半双工总线上下一帧才不会与应答冲突
+        reply = self.gripper.ser.read(_PGE_WRITE_REPLY_LEN)
+        if len(reply) != _PGE_WRITE_REPLY_LEN or reply[1] != 0x10:
+            raise RuntimeError(f"夹爪写寄存器应答异常: {reply.hex()}")
+
     def get_current_position(self):
         """
             获取当前夹爪位置
+
+            立即返回缓存值；若缓存已过期且没有待处理的读请求，
+            则通知总线线程刷新，下次调用即可拿到最新位置
         """
+        if (
+            not self._read_pending
+            and time.monotonic() - self._last_read_ts > self.read_period
+        ):
+            self._read_pending = True
+            self._wakeup.set()
         pos = self._position
         if pos is None:
-            print("未收到位置数据")
+            logger.debug("未收到位置数据")
         return pos
 
     def move(self, position: float, speed: float = 100, force: float = 80) -> None:
         """
         Move the gripper to target position with smoothing.
 
+        The command is queued for the bus thread, so this call never blocks
+        on the serial port.
+
         Args:
             position (float): 输入位置 (0~1000)
             speed (float): 夹爪速度
@@ -52,24 +189,22 @@ class DhGripper:
 
         if self.binary_mode: 
             target_pos = 0 if position < self.threshold else 1000
-
-            if target_pos == self.position:
-                return
+            # 重复命令由下方 _last_queued 判断跳过，写入失败后仍可重发
             self.position = target_pos
         else:
             target_pos = position
 
         # target_pos = self._smooth(target_pos)
 
-        if self.first:
-            self.gripper.set_force(val=force)
-            self.gripper.set_vel(val=speed)
-            self.first = False
-        try:
-            with self._lock:
-                self.gripper.set_pos(val=int(target_pos), is_read=False, blocking=False)
-        except Exception as e:
-            print(f"[Gripper Move Error] {e}")
+        # 与上次放入通道的命令完全相同时直接返回，不唤醒总线线程；
+        # 与已写入总线的命令比较会丢掉仍在通道中等待的新命令
+        cmd = (int(target_pos), speed, force)
+        if cmd == self._last_queued:
+            return
+        self._last_queued = cmd
+
+        self._cmd.append(cmd)
+        self._wakeup.set()
 
     def _smooth(self, new_value: float) -> float:
         """一阶低通滤波"""
@@ -1,13 +1,21 @@
+import logging
+import time
+
 import rospy
 import rospkg
 import roslaunch
 from std_msgs.msg import Float32
 from dh_gripper_msgs.msg import GripperCtrl
 from dh_gripper_msgs.msg import GripperState
+
+logger = logging.getLogger(__name__)
+
+
 class DhGripper:
-    def __init__(self, states_topic, ctrl_topic):
+    def __init__(self, states_topic, ctrl_topic, startup_timeout=2.0):
         """
         初始化夹爪驱动，相当于运行: roslaunch dh_gripper_driver dh_gripper.launch
+        :param startup_timeout: 等待位置数据和控制话题连接的最长时间 (s)
         """
 
         # 启动 roslaunch（方式2: 内部启动）
@@ -18,13 +26,39 @@ class DhGripper:
         launch = roslaunch.parent.ROSLaunchParent(uuid, [launch_file])
         launch.start()
         rospy.init_node("dh_gripper_node", anonymous=True)
-        rospy.sleep(1)
+        deadline = time.monotonic() + startup_timeout
         # 订阅夹爪位置
         self._position = None
-        rospy.Subscriber(states_topic, GripperState, self._position_callback)
-        rospy.sleep(1)
-        # 发布控制命令
-        self.gripper_ctrl_pub = rospy.Publisher(ctrl_topic, GripperCtrl, queue_size=1)
+        rospy.Subscriber(
+            states_topic,
+            GripperState,
+            self._position_callback,
+            queue_size=1,
+            tcp_nodelay=True,
+        )
+        # 收到第一帧位置数据即返回，而不是固定等待
+        while self._position is None and time.monotonic() < deadline:
+            rospy.sleep(0.01)
+        if self._position is None:
+            logger.warning(
+                "%.1fs 内未收到夹爪位置数据 (%s)", startup_timeout, states_topic
+            )
+        # 发布控制命令，复用同一个消息对象
+        self._ctrl_msg = GripperCtrl()
+        self._ctrl_msg.initialize = False
+        self.gripper_ctrl_pub = rospy.Publisher(
+            ctrl_topic, GripperCtrl, queue_size=1, latch=False, tcp_nodelay=True
+        )
+        # 等待驱动订阅控制话题，避免首条命令丢失
+        while (
+            self.gripper_ctrl_pub.get_num_connections() == 0
+            and time.monotonic() < deadline
+        ):
+            rospy.sleep(0.005)
+        if self.gripper_ctrl_pub.get_num_connections() == 0:
+            logger.warning(
+                "%.1fs 内夹爪驱动未订阅控制话题 (%s)", startup_timeout, ctrl_topic
+            )
     
     def _position_callback(self, msg):
         self._position = msg.position
@@ -34,7 +68,7 @@ class DhGripper:
         获取当前夹爪位置
         """
         if self._position is None:
-            print("未收到位置数据")
+            logger.debug("未收到位置数据")
             return None
         return self._position
 
@@ -45,8 +79,7 @@ class DhGripper:
         :param speed: 速度 (float)
         :param force: 夹持力 (float)
         """
-        gripper_msg = GripperCtrl()
-        gripper_msg.initialize = False 
+        gripper_msg = self._ctrl_msg
         gripper_msg.position = position   
         gripper_msg.force = force    
         gripper_msg.speed = speed     
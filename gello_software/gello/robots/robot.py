@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Protocol
 
 import numpy as np
@@ -89,6 +90,8 @@ class BimanualRobot(Robot):
     def __init__(self, robot_l: Robot, robot_r: Robot):
         self._robot_l = robot_l
         self._robot_r = robot_r
+        # Query the right arm on a worker thread so both arms are read concurrently
+        self._obs_executor = ThreadPoolExecutor(max_workers=1)
 
     def num_dofs(self) -> int:
         return self._robot_l.num_dofs() + self._robot_r.num_dofs()
@@ -103,8 +106,9 @@ class BimanualRobot(Robot):
         self._robot_r.command_joint_state(joint_state[self._robot_l.num_dofs() :])
 
     def get_observations(self) -> Dict[str, np.ndarray]:
+        r_future = self._obs_executor.submit(self._robot_r.get_observations)
         l_obs = self._robot_l.get_observations()
-        r_obs = self._robot_r.get_observations()
+        r_obs = r_future.result()
         assert l_obs.keys() == r_obs.keys()
         return_obs = {}
         for k in l_obs.keys():
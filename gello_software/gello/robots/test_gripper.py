@@ -1,5 +1,6 @@
 from pyDHgripper import PGE    
 import time
+from collections import deque
 gripper = PGE(port="/dev/ttyUSB1")
 import time
 import random
@@ -10,12 +11,14 @@ interval = 1.0 / freq  # 每次发送的时间间隔
 
 current_val = 1000
 step_num = 5000
+# 最近 100 个周期的耗时，每秒输出一次平均频率，避免每步打印拖慢循环
+periods = deque(maxlen=100)
+last_report = time.time()
 while step_num > 0:
     start_time = time.time()
 
     # 计算随机步长，确保不会低于0
     step = random.randint(1, 6)  # 步长在10~50之间
-    print("current_val:", current_val)
     current_val -= step
     step_num -= 1
     # 发送命令
@@ -25,4 +28,8 @@ while step_num > 0:
     elapsed = time.time() - start_time
     sleep_time = max(0, interval - elapsed)
     time.sleep(sleep_time)
-    print("freq:",1/(time.time()-start_time))
+    now = time.time()
+    periods.append(now - start_time)
+    if now - last_report >= 1.0:
+        print("current_val:", current_val, "freq:", len(periods) / sum(periods))
+        last_report = now
@@ -0,0 +1,199 @@
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+
+def modbus_crc16(data):
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def write_uart_frame(func, modbus_high_addr, modbus_low_addr, val):
+    """Frame bytes as built by pyDHgripper's PGE.write_uart."""
+    payload = bytes([0x01, func, modbus_high_addr, modbus_low_addr])
+    payload += val.to_bytes(2, byteorder="big", signed=True)
+    crc = modbus_crc16(payload).to_bytes(2, byteorder="big")
+    # write_uart appends (crc_l, crc_h), where crc_h is the big-endian first byte
+    return payload + bytes([crc[1], crc[0]])
+
+
+class FakeSerial:
+    def __init__(self):
+        self.timeout = None
+        self.written = []
+        self.reads = []
+        self.reply = None
+        self.events = []
+
+    def reset_input_buffer(self):
+        self.events.append("reset")
+
+    def write(self, data):
+        self.events.append("write")
+        self.written.append(bytes(data))
+
+    def read(self, size):
+        self.reads.append(size)
+        if self.reply is not None:
+            return self.reply
+        # Echo the 0x10 request header, as the slave does
+        self.events.append("read")
+        header = self.written[-1][:6]
+        return header + modbus_crc16(header).to_bytes(2, byteorder="little")
+
+    def set_low_latency_mode(self, enabled):
+        pass
+
+
+class FakePGE:
+    def __init__(self, port):
+        self.ser = FakeSerial()
+        self.crc16 = modbus_crc16
+        self.forces = []
+        self.read_gate = None
+        self.read_started = None
+
+    def set_force(self, val):
+        self.forces.append(val)
+
+    def read_pos(self, is_read=True):
+        if self.read_started is not None:
+            self.read_started.set()
+        if self.read_gate is not None:
+            self.read_gate.wait()
+        return 500
+
+
+@pytest.fixture
+def dh_gripper(monkeypatch):
+    stub = types.ModuleType("pyDHgripper")
+    stub.PGE = FakePGE
+    monkeypatch.setitem(sys.modules, "pyDHgripper", stub)
+    monkeypatch.delitem(sys.modules, "gello.robots.dh_gripper", raising=False)
+    return importlib.import_module("gello.robots.dh_gripper")
+
+
+@pytest.fixture
+def gripper(dh_gripper):
+    gripper = dh_gripper.DhGripper(
+        port="/dev/null", binary_mode=False, threshold=500, bus_priority=None
+    )
+    yield gripper
+    gripper._stop_flag = True
+    gripper._thread.join(timeout=1)
+
+
+def test_write_pos_speed_frame(gripper):
+    gripper._write_pos_speed(500, 30)
+    frame = gripper.gripper.ser.written[-1]
+
+    pos_frame = write_uart_frame(0x06, 0x01, 0x03, 500)
+    speed_frame = write_uart_frame(0x06, 0x01, 0x04, 30)
+    # Same slave id and starting register as write_uart's set_pos
+    assert frame[0] == pos_frame[0]
+    assert frame[1] == 0x10
+    assert frame[2:4] == pos_frame[2:4]
+    # Two registers, four data bytes, then position and speed values
+    assert frame[4:7] == bytes([0x00, 0x02, 0x04])
+    assert frame[7:9] == pos_frame[4:6]
+    assert frame[9:11] == speed_frame[4:6]
+    # CRC uses write_uart's byte order
+    crc = modbus_crc16(frame[:-2]).to_bytes(2, byteorder="big")
+    assert frame[-2:] == bytes([crc[1], crc[0]])
+
+
+def test_write_pos_speed_waits_for_reply(gripper):
+    gripper._write_pos_speed(500, 30)
+    assert gripper.gripper.ser.reads == [8]
+    # Stale bytes are dropped before the request, the reply is read after it
+    assert gripper.gripper.ser.events == ["reset", "write", "read"]
+    assert gripper.gripper.ser.timeout is not None
+
+
+def test_write_pos_speed_bad_reply(gripper):
+    gripper.gripper.ser.reply = b""
+    with pytest.raises(RuntimeError):
+        gripper._write_pos_speed(500, 30)
+
+
+def wait_for(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def sent_positions(gripper):
+    return [
+        int.from_bytes(frame[7:9], byteorder="big")
+        for frame in gripper.gripper.ser.written
+    ]
+
+
+def test_move_unchanged_command_is_skipped(gripper):
+    gripper.move(300)
+    assert wait_for(lambda: sent_positions(gripper) == [300])
+    gripper.move(300)
+    assert not gripper._cmd
+    assert not gripper._wakeup.is_set()
+
+
+def test_move_does_not_drop_queued_command(dh_gripper):
+    gripper = dh_gripper.DhGripper(
+        port="/dev/null", binary_mode=True, threshold=500, bus_priority=None
+    )
+    try:
+        pge = gripper.gripper
+        gripper.move(0)
+        assert wait_for(lambda: sent_positions(gripper) == [0])
+
+        # Keep the bus thread busy in a position read
+        pge.read_gate = threading.Event()
+        pge.read_started = threading.Event()
+        gripper._last_read_ts = 0.0
+        gripper.get_current_position()
+        assert pge.read_started.wait(timeout=1)
+
+        gripper.move(1000)
+        gripper.move(0)
+        pge.read_gate.set()
+
+        assert wait_for(lambda: len(sent_positions(gripper)) == 2)
+        assert sent_positions(gripper)[-1] == 0
+        assert not gripper._cmd
+    finally:
+        gripper._stop_flag = True
+        gripper._thread.join(timeout=1)
+
+
+def test_binary_move_resends_after_failed_write(dh_gripper):
+    gripper = dh_gripper.DhGripper(
+        port="/dev/null", binary_mode=True, threshold=500, bus_priority=None
+    )
+    try:
+        ser = gripper.gripper.ser
+        ser.reply = b""
+        gripper.move(0)
+        assert wait_for(lambda: len(ser.written) == 1)
+        assert wait_for(lambda: gripper._last_queued is None)
+
+        ser.reply = None
+        gripper.move(0)
+        assert wait_for(lambda: len(ser.written) == 2)
+        assert sent_positions(gripper) == [0, 0]
+        # Once the write succeeded, the same command is skipped again
+        gripper.move(0)
+        assert not gripper._cmd
+    finally:
+        gripper._stop_flag = True
+        gripper._thread.join(timeout=1)
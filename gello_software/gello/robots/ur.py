@@ -44,9 +44,6 @@ class URRobot(Robot):
         return 6
 
     def _get_gripper_pos(self) -> float:
-        import time
-
-        time.sleep(0.01)
         gripper_pos = self.gripper.get_current_position()
         assert 0 <= gripper_pos <= 1000, "Gripper position must be between 0 and 1000"
         return gripper_pos / 1000
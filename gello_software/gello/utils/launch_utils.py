@@ -1,11 +1,32 @@
+import copy
+import functools
 import importlib
+import os
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 from omegaconf import OmegaConf
 
+# Resolved YAML configs keyed by (absolute path, mtime)
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+
+def load_yaml(path: str) -> Dict[str, Any]:
+    """Load and resolve a YAML config, reusing the parse while the file is unchanged."""
+    abspath = os.path.abspath(path)
+    key = (abspath, os.path.getmtime(abspath))
+    if key not in _CONFIG_CACHE:
+        # Keep at most one entry per file: drop parses of older versions
+        for stale in [k for k in _CONFIG_CACHE if k[0] == abspath]:
+            del _CONFIG_CACHE[stale]
+        _CONFIG_CACHE[key] = OmegaConf.to_container(
+            OmegaConf.load(abspath), resolve=True
+        )
+    # Callers mutate the result, so never hand out the cached dict itself
+    return copy.deepcopy(_CONFIG_CACHE[key])
+
 
 class SimpleLaunchManager:
     """Simplified launch manager for robot systems."""
@@ -17,17 +38,17 @@ class SimpleLaunchManager:
         self.agent = None
         self.env = None
         self.server_thread = None
+        # Reused command buffer for the smoothing steps in run_control_loop
+        self._cmd_buf: Optional[np.ndarray] = None
 
     def _load_config(self) -> Dict[str, Any]:
         """Load and resolve configuration."""
-        cfg = OmegaConf.to_container(OmegaConf.load(self.config_path), resolve=True)
+        cfg = load_yaml(self.config_path)
 
         # Handle robot config
         robot_cfg = cfg["robot"]
         if isinstance(robot_cfg.get("config"), str):
-            robot_cfg["config"] = OmegaConf.to_container(
-                OmegaConf.load(robot_cfg["config"]), resolve=True
-            )
+            robot_cfg["config"] = load_yaml(robot_cfg["config"])
 
         return cfg
 
@@ -66,7 +87,11 @@ class SimpleLaunchManager:
     def setup_communication(self):
         """Setup ZMQ communication for the robot."""
         from gello.env import RobotEnv
-        from gello.zmq_core.robot_node import ZMQClientRobot, ZMQServerRobot
+        from gello.zmq_core.robot_node import (
+            ZMQClientRobot,
+            ZMQServerRobot,
+            loopback_ipc_endpoint,
+        )
 
         robot_cfg = self.cfg["robot"]
 
@@ -83,14 +108,19 @@ class SimpleLaunchManager:
                 host=robot_cfg.get("host", "127.0.0.1"),
             )
         else:  # Direct robot (hardware)
-            # Create ZMQ server for the hardware robot
-            server = ZMQServerRobot(self.robot, port=6001, host="127.0.0.1")
+            # Create ZMQ server for the hardware robot (ipc:// on loopback)
+            endpoint = loopback_ipc_endpoint(6001, "127.0.0.1")
+            server = ZMQServerRobot(
+                self.robot, port=6001, host="127.0.0.1", endpoint=endpoint
+            )
             self.server_thread = threading.Thread(target=server.serve, daemon=True)
             self.server_thread.start()
             time.sleep(1)
 
             # Create client to communicate with hardware
-            robot_client = ZMQClientRobot(port=6001, host="127.0.0.1")
+            robot_client = ZMQClientRobot(
+                port=6001, host="127.0.0.1", endpoint=endpoint
+            )
 
         self.env = RobotEnv(robot_client, control_rate_hz=self.cfg.get("hz", 30))
 
@@ -101,9 +131,8 @@ class SimpleLaunchManager:
 
     def move_to_joints(self, joints: np.ndarray):
         """Move robot to specified joints."""
-        for jnt in np.linspace(self.env.get_obs()["joint_positions"], joints, 100):
-            self.env.step(jnt)
-            time.sleep(0.001)
+        traj = np.linspace(self.env.get_obs()["joint_positions"], joints, 100)
+        _step_trajectory(self.env, traj, self.cfg.get("hz", 30))
 
     def validate_agent_output(self):
         """Validate that agent output matches environment dimensions."""
@@ -151,17 +180,21 @@ class SimpleLaunchManager:
                 )
             return
 
-        # Smooth initial movement
+        # Smooth initial movement, reusing one buffer for delta and command
         max_delta = 1.0
+        if self._cmd_buf is None or self._cmd_buf.shape != joints.shape:
+            self._cmd_buf = np.empty_like(joints)
+        delta = self._cmd_buf
         for _ in range(25):
             obs = self.env.get_obs()
             command_joints = self.agent.act(obs)
             current_joints = obs["joint_positions"]
-            delta = command_joints - current_joints
-            max_joint_delta = np.abs(delta).max()
+            np.subtract(command_joints, current_joints, out=delta)
+            max_joint_delta = max(delta.max(), -delta.min())
             if max_joint_delta > max_delta:
-                delta = delta / max_joint_delta * max_delta
-            self.env.step(current_joints + delta)
+                np.multiply(delta, max_delta / max_joint_delta, out=delta)
+            np.add(current_joints, delta, out=delta)
+            self.env.step(delta)
 
         # Main control loop
         print("Starting main control loop...")
@@ -231,18 +264,35 @@ def move_to_start_position(
     steps = min(int(max_delta / 0.01), 100)
 
     print(f"Moving robot to start position: {reset_joints}")
-    for jnt in np.linspace(curr_joints, reset_joints, steps):
+    traj = np.linspace(curr_joints, reset_joints, steps)
+    _step_trajectory(env, traj, left_cfg.get("hz", 30))
+
+
+def _step_trajectory(env, traj: np.ndarray, hz: float) -> None:
+    """Step through a precomputed trajectory on a fixed monotonic schedule."""
+    dt = 1.0 / hz
+    t0 = time.monotonic()
+    for i, jnt in enumerate(traj):
         env.step(jnt)
-        time.sleep(0.001)
+        remaining = t0 + (i + 1) * dt - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(target: str):
+    """Resolve a dotted `_target_` path to the object it names."""
+    module_path, class_name = target.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), class_name)
 
 
 def instantiate_from_dict(cfg):
     """Instantiate objects from configuration."""
     if isinstance(cfg, dict) and "_target_" in cfg:
-        module_path, class_name = cfg["_target_"].rsplit(".", 1)
-        cls = getattr(importlib.import_module(module_path), class_name)
-        kwargs = {k: v for k, v in cfg.items() if k != "_target_"}
-        return cls(**{k: instantiate_from_dict(v) for k, v in kwargs.items()})
+        cls = _resolve(cfg["_target_"])
+        return cls(
+            **{k: instantiate_from_dict(v) for k, v in cfg.items() if k != "_target_"}
+        )
     elif isinstance(cfg, dict):
         return {k: instantiate_from_dict(v) for k, v in cfg.items()}
     elif isinstance(cfg, list):
@@ -1,6 +1,7 @@
+import os
 import pickle
 import threading
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import numpy as np
 import zmq
@@ -10,25 +11,54 @@ from gello.robots.robot import Robot
 DEFAULT_ROBOT_PORT = 6000
 
 
+def loopback_ipc_endpoint(port: int, host: str) -> Optional[str]:
+    """Get an ipc:// endpoint to use instead of TCP for a loopback host.
+
+    The socket uses the Linux abstract namespace, so no file is left behind
+    and a second bind fails with EADDRINUSE like TCP. It is tagged with the
+    current PID, so only a server and client in this process share it.
+
+    Args:
+        port (int): The TCP port the robot would otherwise use.
+        host (str): The TCP host the robot would otherwise use.
+
+    Returns:
+        Optional[str]: The ipc:// endpoint, or None if the host is not loopback.
+    """
+    if host in ("127.0.0.1", "localhost"):
+        return f"ipc://@gello_robot_{port}_{os.getpid()}"
+    return None
+
+
 class ZMQServerRobot:
     def __init__(
         self,
         robot: Robot,
         port: int = DEFAULT_ROBOT_PORT,
         host: str = "127.0.0.1",
+        endpoint: Optional[str] = None,
     ):
         self._robot = robot
         self._context = zmq.Context()
         self._socket = self._context.socket(zmq.REP)
-        addr = f"tcp://{host}:{port}"
+        addr = endpoint or f"tcp://{host}:{port}"
         debug_message = f"Robot Sever Binding to {addr}, Robot: {robot}"
         print(debug_message)
         self._timout_message = f"Timeout in Robot Server, Robot: {robot}"
         self._socket.bind(addr)
         self._stop_event = threading.Event()
+        self._serving = threading.Event()
+        self._closed = threading.Event()
 
     def serve(self) -> None:
         """Serve the leader robot state over ZMQ."""
+        self._serving.set()
+        try:
+            self._serve_loop()
+        finally:
+            self._close()
+
+    def _serve_loop(self) -> None:
         self._socket.setsockopt(zmq.RCVTIMEO, 1000)  # Set timeout to 1000 ms
         while not self._stop_event.is_set():
             try:
@@ -61,17 +91,35 @@ class ZMQServerRobot:
                 pass
 
     def stop(self) -> None:
-        """Signal the server to stop serving."""
+        """Stop serving and release the bound address."""
         self._stop_event.set()
+        if self._serving.is_set():
+            # serve() notices the stop within one receive timeout and closes
+            self._closed.wait(timeout=2)
+        else:
+            self._close()
+
+    def _close(self) -> None:
+        """Close the socket and context, freeing the endpoint for a new bind."""
+        if self._closed.is_set():
+            return
+        self._socket.close(linger=0)
+        self._context.term()
+        self._closed.set()
 
 
 class ZMQClientRobot(Robot):
     """A class representing a ZMQ client for a leader robot."""
 
-    def __init__(self, port: int = DEFAULT_ROBOT_PORT, host: str = "127.0.0.1"):
+    def __init__(
+        self,
+        port: int = DEFAULT_ROBOT_PORT,
+        host: str = "127.0.0.1",
+        endpoint: Optional[str] = None,
+    ):
         self._context = zmq.Context()
         self._socket = self._context.socket(zmq.REQ)
-        self._socket.connect(f"tcp://{host}:{port}")
+        self._socket.connect(endpoint or f"tcp://{host}:{port}")
 
     def num_dofs(self) -> int:
         """Get the number of joints in the robot.
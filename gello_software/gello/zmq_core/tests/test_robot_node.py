@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+import zmq
+
+from gello.robots.robot import PrintRobot
+from gello.zmq_core.robot_node import (
+    ZMQClientRobot,
+    ZMQServerRobot,
+    loopback_ipc_endpoint,
+)
+
+PORT = 6987
+
+
+@pytest.fixture
+def endpoint():
+    return loopback_ipc_endpoint(PORT, "127.0.0.1")
+
+
+def start_server(endpoint):
+    server = ZMQServerRobot(PrintRobot(3, True), port=PORT, endpoint=endpoint)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def test_loopback_ipc_endpoint():
+    assert loopback_ipc_endpoint(PORT, "localhost").startswith("ipc://@")
+    assert loopback_ipc_endpoint(PORT, "192.168.1.10") is None
+
+
+def test_second_bind_fails(endpoint):
+    server = ZMQServerRobot(PrintRobot(3, True), port=PORT, endpoint=endpoint)
+    try:
+        with pytest.raises(zmq.ZMQError):
+            ZMQServerRobot(PrintRobot(3, True), port=PORT, endpoint=endpoint)
+    finally:
+        server.stop()
+
+
+def test_stop_then_rebind(endpoint):
+    for _ in range(2):
+        server, thread = start_server(endpoint)
+        client = ZMQClientRobot(port=PORT, endpoint=endpoint)
+        assert client.num_dofs() == 3
+        client.close()
+        server.stop()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+
+def test_stop_without_serve_then_rebind(endpoint):
+    ZMQServerRobot(PrintRobot(3, True), port=PORT, endpoint=endpoint).stop()
+    ZMQServerRobot(PrintRobot(3, True), port=PORT, endpoint=endpoint).stop()